@@ -4,15 +4,120 @@ Complete with logging, caching, and rate limiting
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 import sys
+import csv
+import io
 import json
-import argparse
 import logging
+import mmap
+import os
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import compress, islice
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import time
 
+try:
+    import ijson
+except ImportError:  # optional: incremental parsing for --limit runs
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON codec
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional: on-disk HTTP caching
+    requests_cache = None
+
+
+# Working directories, relative to the current directory
+CACHE_DIR = Path('cache')
+LOG_DIR = Path('logs')
+OUTPUT_DIR = Path('output')
+
+# Per-user state directory (HTTP cache, circuit-breaker state)
+USER_CACHE_DIR = Path.home() / '.cache' / 'user_fetcher'
+
+# Shared read-only default for missing nested objects (address, company)
+_EMPTY: Dict = {}
+
+# Separators, built once rather than on every print
+_BANNER = "=" * 70
+_SEP_PRETTY = "─" * 60
+_SEP_MINIMAL = "-" * 24
+
+# Per-user output templates for the display helpers
+_PRETTY_TMPL = (
+    "👤 User {idx}:\n"
+    "   Name:     {name}\n"
+    "   Username: {username}\n"
+    "   Email:    {email}\n"
+    "   City:     {city}\n"
+    "   Phone:    {phone}\n"
+    "   Company:  {company}\n"
+    "   Website:  {website}\n"
+    + _SEP_PRETTY + "\n"
+)
+_MINIMAL_TMPL = (
+    "User {idx}:\n"
+    "Name: {name}\n"
+    "Username: {username}\n"
+    "Email: {email}\n"
+    "City: {city}\n"
+    + _SEP_MINIMAL + "\n"
+)
+
+
+_created_dirs = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) at most once per process"""
+    key = path.absolute()
+    if key not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(key)
+    return path
+
+
+@lru_cache(maxsize=1024)
+def _starts_with_s(city: str) -> bool:
+    """Return True if the city name starts with 'S' (memoized per city)"""
+    return city.startswith('S')
+
+
+def _city_of(user: Dict) -> Optional[str]:
+    """Return the user's city, or None when it is missing, null or not a string"""
+    city = (user.get('address') or _EMPTY).get('city')
+    return city if isinstance(city, str) else None
+
+
+def _fold(value) -> str:
+    """Casefold a field value for searching; None (JSON null) becomes ''"""
+    return '' if value is None else str(value).casefold()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
 
 # Configure logging
 def setup_logging(log_file: str = 'user_fetcher.log', verbose: bool = False):
@@ -20,8 +125,7 @@ def setup_logging(log_file: str = 'user_fetcher.log', verbose: bool = False):
     log_level = logging.DEBUG if verbose else logging.INFO
     
     # Create logs directory if it doesn't exist
-    log_dir = Path('logs')
-    log_dir.mkdir(exist_ok=True)
+    log_dir = _ensure_dir(LOG_DIR)
     
     logging.basicConfig(
         level=log_level,
@@ -37,6 +141,12 @@ def setup_logging(log_file: str = 'user_fetcher.log', verbose: bool = False):
 class CacheManager:
     """Simple cache manager for API responses"""
     
+    # Files at least this large are parsed from an mmap instead of read() into memory
+    MMAP_THRESHOLD = 64 * 1024
+    
+    # Process-wide copy of each cache file's data: path -> (monotonic stamp, data)
+    _mem: Dict[Path, Tuple[float, List[Dict]]] = {}
+    
     def __init__(self, cache_duration: int = 300):
         """
         Initialize cache manager.
@@ -45,48 +155,153 @@ class CacheManager:
             cache_duration (int): Cache duration in seconds (default: 5 minutes)
         """
         self.cache_duration = cache_duration
-        self.cache_file = Path('cache') / 'api_cache.json'
-        self.cache_file.parent.mkdir(exist_ok=True)
+        self.cache_file = _ensure_dir(CACHE_DIR) / 'api_cache.json'
     
-    def get(self) -> Optional[Dict]:
-        """Get cached data if valid"""
+    def get_entry(self) -> Optional[Dict]:
+        """Get the raw cache entry (data, timestamp, validators), even if expired"""
         if not self.cache_file.exists():
             return None
         
         try:
-            with open(self.cache_file, 'r') as f:
-                cached_data = json.load(f)
-            
-            cache_time = datetime.fromisoformat(cached_data['timestamp'])
-            if datetime.now() - cache_time < timedelta(seconds=self.cache_duration):
+            with open(self.cache_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if orjson is not None and size >= self.MMAP_THRESHOLD:
+                    # orjson parses the mapped pages in place, skipping the read() copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as mv:
+                        return orjson.loads(mv)
+                return _loads(f.read())
+        except Exception as e:
+            logging.warning("Cache read error: %s", e)
+        
+        return None
+    
+    def get(self) -> Optional[Dict]:
+        """Get cached data if valid, checking the in-memory copy before the disk"""
+        key = self.cache_file.absolute()
+        mem = CacheManager._mem.get(key)
+        if mem and time.monotonic() - mem[0] < self.cache_duration:
+            return mem[1]
+        
+        cached_data = self.get_entry()
+        if not cached_data:
+            return None
+        
+        try:
+            age = datetime.now() - datetime.fromisoformat(cached_data['timestamp'])
+            if age < timedelta(seconds=self.cache_duration):
+                # Stamp with the entry's real age so the memory copy expires with it
+                CacheManager._mem[key] = (time.monotonic() - age.total_seconds(), cached_data['data'])
                 return cached_data['data']
         except Exception as e:
-            logging.warning(f"Cache read error: {e}")
+            logging.warning("Cache read error: %s", e)
         
         return None
     
-    def set(self, data: List[Dict]) -> None:
-        """Save data to cache"""
+    def set(self, data: List[Dict], etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Save data to cache, along with any HTTP validators for revalidation.
+        
+        Args:
+            data (List[Dict]): User data to cache
+            etag (str): ETag response header, if any
+            last_modified (str): Last-Modified response header, if any
+        """
         try:
             cache_data = {
                 'timestamp': datetime.now().isoformat(),
+                'etag': etag,
+                'last_modified': last_modified,
                 'data': data
             }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f)
+            # Write to a temp file and swap it in so readers never see a partial file
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(cache_data))
+            os.replace(tmp_file, self.cache_file)
+            CacheManager._mem[self.cache_file.absolute()] = (time.monotonic(), data)
         except Exception as e:
-            logging.warning(f"Cache write error: {e}")
+            logging.warning("Cache write error: %s", e)
     
     def clear(self) -> None:
         """Clear cache"""
+        CacheManager._mem.pop(self.cache_file.absolute(), None)
         if self.cache_file.exists():
             self.cache_file.unlink()
 
 
+class CircuitBreaker:
+    """File-backed circuit breaker that fails fast after repeated API failures"""
+    
+    def __init__(self, threshold: int = 3, cooldown: int = 60):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            threshold (int): Consecutive failures before the circuit opens
+            cooldown (int): Seconds the circuit stays open before a probe is allowed
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state_file = USER_CACHE_DIR / 'breaker.json'
+        self.failure_count = 0
+        self.opened_at = None
+        self._load()
+    
+    def _load(self) -> None:
+        """Load persisted breaker state, if any"""
+        if not self.state_file.exists():
+            return
+        
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            self.failure_count = int(state.get('failure_count', 0))
+            self.opened_at = state.get('opened_at')
+        except Exception as e:
+            logging.warning("Circuit breaker read error: %s", e)
+    
+    def _save(self) -> None:
+        """Persist breaker state so it survives across invocations"""
+        try:
+            _ensure_dir(self.state_file.parent)
+            with open(self.state_file, 'w') as f:
+                json.dump({'failure_count': self.failure_count, 'opened_at': self.opened_at}, f)
+        except Exception as e:
+            logging.warning("Circuit breaker write error: %s", e)
+    
+    def allow_request(self) -> bool:
+        """Return False while the circuit is open and still cooling down"""
+        if self.failure_count < self.threshold or self.opened_at is None:
+            return True
+        # Half-open: let a probe request through once the cooldown has passed
+        return time.time() - self.opened_at >= self.cooldown
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful request"""
+        if self.failure_count or self.opened_at is not None:
+            self.failure_count = 0
+            self.opened_at = None
+            self._save()
+    
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold"""
+        self.failure_count += 1
+        if self.failure_count >= self.threshold:
+            self.opened_at = time.time()
+        self._save()
+
+
 class UserFetcher:
     """Enhanced class to handle fetching and displaying user data from API"""
     
     BASE_URL = "https://jsonplaceholder.typicode.com/users"
+    MAX_JITTER = 0.5
+    MAX_CONCURRENCY = 10
+    DEFAULT_HEADERS = {
+        'User-Agent': 'UserFetcher/3.0',
+        'Accept': 'application/json'
+    }
     
     def __init__(self, timeout: int = 10, use_cache: bool = True, logger=None):
         """
@@ -98,26 +313,120 @@ class UserFetcher:
             logger: Logger instance
         """
         self.timeout = timeout
-        self.users = None
+        self._users: Optional[List[Dict]] = None
+        # Casefolded search values per field, aligned with self.users
+        self._search_index: Dict[str, List[str]] = {}
+        # Per-field columns extracted from self.users (see _build_columns)
+        self._names: List[str] = []
+        self._usernames: List[str] = []
+        self._emails: List[str] = []
+        self._cities: List[str] = []
+        self._phones: List[str] = []
+        self._companies: List[str] = []
+        self._websites: List[str] = []
+        self._domains: List[Optional[str]] = []
+        self._starts_s_mask: List[bool] = []
         self.use_cache = use_cache
         self.cache = CacheManager() if use_cache else None
         self.logger = logger or logging.getLogger(__name__)
-        self.last_request_time = None
+        self._next_allowed = 0.0
+        self.breaker = CircuitBreaker(threshold=3, cooldown=60)
+        self._formatters = {
+            'pretty': self._display_pretty,
+            'json': self._display_json,
+            'csv': self._display_csv,
+            'minimal': self._display_minimal
+        }
+        
+        # Persistent session so repeated requests reuse keep-alive connections,
+        # with exponential backoff on transient failures
+        retry = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_jitter=self.MAX_JITTER,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            # Leave the final 5xx response to raise_for_status() so it surfaces as HTTPError
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        if use_cache and requests_cache is not None:
+            # SQLite-backed cache revalidated with ETag/Last-Modified once expired
+            _ensure_dir(USER_CACHE_DIR)
+            self.session = requests_cache.CachedSession(
+                cache_name=str(USER_CACHE_DIR / 'users_cache'),
+                backend='sqlite',
+                expire_after=3600,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        # requests-cache revalidates on its own; otherwise send the validators we cached
+        self.revalidate = use_cache and not hasattr(self.session, 'cache')
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _rate_limit(self, min_interval: float = 1.0):
-        """Simple rate limiting"""
-        if self.last_request_time:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-        self.last_request_time = time.time()
-    
-    def fetch_users(self, force_refresh: bool = False) -> Optional[List[Dict]]:
+        """Simple rate limiting on the monotonic clock (immune to wall-clock jumps)"""
+        now = time.monotonic()
+        if now < self._next_allowed:
+            time.sleep(self._next_allowed - now)
+        self._next_allowed = time.monotonic() + min_interval
+    
+    def _get(self, url: str, headers: Optional[Dict] = None,
+             stream: bool = False) -> requests.Response:
+        """GET a URL with the fetcher's timeout (retries are handled by the adapter)"""
+        return self.session.get(url, headers=headers, timeout=self.timeout, stream=stream)
+    
+    def _stream_users(self, response: requests.Response, limit: int) -> Tuple[List[Dict], bool]:
+        """
+        Incrementally parse users from a streamed response, stopping at limit.
+        
+        Returns:
+            Tuple[List[Dict], bool]: Parsed users, and whether parsing stopped early
+        """
+        response.raw.decode_content = True
+        users = []
+        try:
+            for user in ijson.items(response.raw, 'item', use_float=True):
+                users.append(user)
+                if len(users) >= limit:
+                    return users, True
+        except ijson.JSONError as e:
+            raise ValueError(e) from e
+        # Reading response.raw skips requests' exception wrapping, so map urllib3's errors
+        # the way iter_content() would
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e) from e
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e) from e
+        finally:
+            response.close()
+        return users, False
+    
+    def fetch_users(self, force_refresh: bool = False,
+                    limit: Optional[int] = None) -> Optional[List[Dict]]:
         """
         Fetch users from the JSONPlaceholder API with caching support.
         
         Args:
             force_refresh (bool): Force refresh even if cache exists
+            limit (int): Only the first `limit` users are needed; with ijson
+                installed and caching off, parsing stops there
         
         Returns:
             List[Dict]: List of user dictionaries if successful, None otherwise
@@ -131,17 +440,49 @@ class UserFetcher:
                 self.users = cached_data
                 return cached_data
         
+        if not self.breaker.allow_request():
+            self.logger.error("Circuit breaker open, skipping request")
+            print("⛔ Error: API unavailable after repeated failures. Try again later.")
+            return None
+        
         try:
-            self.logger.info(f"Fetching data from {self.BASE_URL}")
+            self.logger.info("Fetching data from %s", self.BASE_URL)
             print("🔄 Fetching data from API...")
             
             # Apply rate limiting
             self._rate_limit()
             
-            response = requests.get(self.BASE_URL, timeout=self.timeout)
+            # Conditional GET: a 304 lets us reuse the expired cache entry
+            cached_entry = self.cache.get_entry() if self.revalidate else None
+            headers = {}
+            if cached_entry:
+                if cached_entry.get('etag'):
+                    headers['If-None-Match'] = cached_entry['etag']
+                if cached_entry.get('last_modified'):
+                    headers['If-Modified-Since'] = cached_entry['last_modified']
+            
+            # Stream-parse when only a prefix is needed and nothing will be cached;
+            # with caching on, the full list is parsed so it can be stored
+            stream = bool(limit and limit > 0) and ijson is not None and not self.use_cache
+            truncated = False
+            
+            response = self._get(self.BASE_URL, headers=headers or None, stream=stream)
             response.raise_for_status()
+            self.breaker.record_success()
+            if getattr(response, 'from_cache', False):
+                self.logger.info("Response served from HTTP cache")
             
-            users = response.json()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if response.status_code == 304 and headers:
+                self.logger.info("Not modified, reusing cached data")
+                users = cached_entry['data']
+                etag = etag or cached_entry.get('etag')
+                last_modified = last_modified or cached_entry.get('last_modified')
+            elif stream:
+                users, truncated = self._stream_users(response, limit)
+            else:
+                users = _loads(response.content)
             
             if not users:
                 self.logger.warning("API returned empty list")
@@ -150,36 +491,160 @@ class UserFetcher:
             
             self.users = users
             
-            # Cache the data
-            if self.use_cache:
-                self.cache.set(users)
+            # Cache the data (never a partial, early-stopped result)
+            if self.use_cache and not truncated:
+                self.cache.set(users, etag=etag, last_modified=last_modified)
                 self.logger.info("Data cached successfully")
             
-            self.logger.info(f"Successfully fetched {len(users)} users")
+            self.logger.info("Successfully fetched %d users", len(users))
             print(f"✅ Successfully fetched {len(users)} users.\n")
             return users
             
         except requests.exceptions.Timeout:
+            self.breaker.record_failure()
             self.logger.error("Request timeout")
             print("❌ Error: Request timed out. Please check your internet connection.")
             return None
         except requests.exceptions.ConnectionError:
+            self.breaker.record_failure()
             self.logger.error("Connection error")
             print("❌ Error: Failed to connect to the API. Please check your internet connection.")
             return None
         except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error: {e}")
+            self.breaker.record_failure()
+            self.logger.error("HTTP error: %s", e)
             print(f"❌ Error: HTTP error occurred: {e}")
             return None
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request error: {e}")
+            self.breaker.record_failure()
+            self.logger.error("Request error: %s", e)
             print(f"❌ Error: An error occurred while fetching data: {e}")
             return None
         except ValueError as e:
-            self.logger.error(f"JSON parse error: {e}")
+            self.logger.error("JSON parse error: %s", e)
             print("❌ Error: Failed to parse JSON response.")
             return None
     
+    @property
+    def users(self) -> Optional[List[Dict]]:
+        """Loaded user records, or None before a successful fetch"""
+        return self._users
+    
+    @users.setter
+    def users(self, users: Optional[List[Dict]]) -> None:
+        # Keep the derived columns in step with every assignment
+        self._users = users
+        self._build_columns()
+    
+    def _build_columns(self) -> None:
+        """Extract display values from self.users into per-field columns in one pass"""
+        self._names, self._usernames, self._emails, self._cities = [], [], [], []
+        self._phones, self._companies, self._websites, self._domains = [], [], [], []
+        # Search on raw values ('' when missing) so queries never match 'N/A'
+        search_name, search_username, search_email, search_city = [], [], [], []
+        
+        for user in self._users or ():
+            get = user.get
+            city = _city_of(user)
+            search_name.append(_fold(get('name')))
+            search_username.append(_fold(get('username')))
+            search_email.append(_fold(get('email')))
+            search_city.append(_fold(city))
+            
+            email = get('email', 'N/A')
+            self._names.append(get('name', 'N/A'))
+            self._usernames.append(get('username', 'N/A'))
+            self._emails.append(email)
+            self._cities.append(city if city is not None else 'N/A')
+            self._phones.append(get('phone', 'N/A'))
+            self._companies.append((get('company') or _EMPTY).get('name', 'N/A'))
+            self._websites.append(get('website', 'N/A'))
+            _, sep, domain = email.rpartition('@') if isinstance(email, str) else ('', '', '')
+            self._domains.append(domain if sep else None)
+        
+        self._starts_s_mask = [_starts_with_s(city) for city in self._cities]
+        self._search_index = {
+            'name': search_name,
+            'username': search_username,
+            'email': search_email,
+            'city': search_city
+        }
+    
+    async def _fetch_one(self, client, semaphore, url: str, http2: bool):
+        """Fetch and parse a single URL, bounded by the shared semaphore"""
+        async with semaphore:
+            self.logger.debug("Async fetch: %s", url)
+            if http2:
+                response = await client.get(url)
+                response.raise_for_status()
+                return _loads(response.content)
+            async with client.get(url) as response:
+                response.raise_for_status()
+                return _loads(await response.read())
+    
+    async def afetch(self, urls: List[str]) -> List:
+        """
+        Fetch several URLs concurrently.
+        
+        Uses an HTTP/2 httpx client when available, so concurrent requests to
+        the same host share one multiplexed connection; otherwise aiohttp.
+        
+        Args:
+            urls (List[str]): URLs to fetch
+        
+        Returns:
+            List: Parsed JSON payloads, in the same order as urls
+        
+        Raises:
+            RuntimeError: If neither httpx[http2] nor aiohttp is installed
+        """
+        # Imported here: the async stack is slow to import and the CLI never needs it
+        import asyncio
+        try:
+            import httpx
+            import h2  # noqa: F401 -- needed for httpx HTTP/2 support
+            http2 = True
+        except ImportError:
+            http2 = False
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        if http2:
+            client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                headers=self.DEFAULT_HEADERS,
+                limits=httpx.Limits(max_connections=self.MAX_CONCURRENCY)
+            )
+        else:
+            try:
+                import aiohttp
+            except ImportError:
+                raise RuntimeError("httpx[http2] or aiohttp is required for async fetching") from None
+            client = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.MAX_CONCURRENCY),
+                headers=self.DEFAULT_HEADERS
+            )
+        
+        async with client:
+            return await asyncio.gather(
+                *(self._fetch_one(client, semaphore, url, http2) for url in urls)
+            )
+    
+    def fetch_many(self, urls: List[str]) -> List:
+        """
+        Fetch several URLs concurrently from synchronous code.
+        
+        Args:
+            urls (List[str]): URLs to fetch
+        
+        Returns:
+            List: Parsed JSON payloads, in the same order as urls
+        """
+        import asyncio
+        return asyncio.run(self.afetch(urls))
+    
     def display_users(self, users: List[Dict], filter_by_s: bool = False, 
                      format_type: str = 'pretty', limit: Optional[int] = None) -> None:
         """Display user information in various formats"""
@@ -188,97 +653,107 @@ class UserFetcher:
             print("⚠️  No users to display.")
             return
         
-        # Filter users
-        filtered_users = []
-        for user in users:
-            city = user.get('address', {}).get('city', 'N/A')
-            if not filter_by_s or city.startswith('S'):
-                filtered_users.append(user)
-        
-        if limit:
-            filtered_users = filtered_users[:limit]
+        # Filter users lazily so iteration stops once the limit is reached
+        if filter_by_s and users is self.users:
+            # Reuse the mask computed when the data was loaded
+            matches = compress(users, self._starts_s_mask)
+        else:
+            # A city _city_of rejects shows as 'N/A' in the columns, which never matches
+            matches = (
+                user for user, city in zip(users, map(_city_of, users))
+                if not filter_by_s or (city is not None and _starts_with_s(city))
+            )
+        if limit and limit > 0:
+            filtered_users = list(islice(matches, limit))
+        else:
+            filtered_users = list(matches)
         
         if not filtered_users:
             self.logger.info("No users match filter criteria")
             print("ℹ️  No users found matching the criteria.")
             return
         
-        self.logger.info(f"Displaying {len(filtered_users)} users in {format_type} format")
+        self.logger.info("Displaying %d users in %s format", len(filtered_users), format_type)
         
         # Display based on format
-        if format_type == 'json':
-            self._display_json(filtered_users)
-        elif format_type == 'csv':
-            self._display_csv(filtered_users)
-        elif format_type == 'minimal':
-            self._display_minimal(filtered_users)
-        else:
-            self._display_pretty(filtered_users)
+        self._formatters.get(format_type, self._display_pretty)(filtered_users)
     
     def _display_pretty(self, users: List[Dict]) -> None:
         """Display users in pretty formatted style"""
+        buf = []
         for idx, user in enumerate(users, start=1):
             try:
-                name = user.get('name', 'N/A')
-                username = user.get('username', 'N/A')
-                email = user.get('email', 'N/A')
-                city = user.get('address', {}).get('city', 'N/A')
-                phone = user.get('phone', 'N/A')
-                company = user.get('company', {}).get('name', 'N/A')
-                website = user.get('website', 'N/A')
+                get = user.get
+                name = get('name', 'N/A')
+                username = get('username', 'N/A')
+                email = get('email', 'N/A')
+                city = (get('address') or _EMPTY).get('city', 'N/A')
+                phone = get('phone', 'N/A')
+                company = (get('company') or _EMPTY).get('name', 'N/A')
+                website = get('website', 'N/A')
                 
-                print(f"👤 User {idx}:")
-                print(f"   Name:     {name}")
-                print(f"   Username: {username}")
-                print(f"   Email:    {email}")
-                print(f"   City:     {city}")
-                print(f"   Phone:    {phone}")
-                print(f"   Company:  {company}")
-                print(f"   Website:  {website}")
-                print("─" * 60)
+                buf.append(_PRETTY_TMPL.format(
+                    idx=idx, name=name, username=username, email=email,
+                    city=city, phone=phone, company=company, website=website
+                ))
                 
             except (KeyError, TypeError) as e:
-                self.logger.warning(f"Error parsing user {idx}: {e}")
-                print(f"⚠️  Warning: Could not parse user {idx} data: {e}")
+                self.logger.warning("Error parsing user %d: %s", idx, e)
+                buf.append(f"⚠️  Warning: Could not parse user {idx} data: {e}\n")
+        
+        # Single write instead of one print() per line
+        sys.stdout.write(''.join(buf))
     
     def _display_minimal(self, users: List[Dict]) -> None:
         """Display users in minimal style"""
+        buf = []
         for idx, user in enumerate(users, start=1):
             try:
-                print(f"User {idx}:")
-                print(f"Name: {user.get('name', 'N/A')}")
-                print(f"Username: {user.get('username', 'N/A')}")
-                print(f"Email: {user.get('email', 'N/A')}")
-                print(f"City: {user.get('address', {}).get('city', 'N/A')}")
-                print("-" * 24)
+                get = user.get
+                buf.append(_MINIMAL_TMPL.format(
+                    idx=idx,
+                    name=get('name', 'N/A'),
+                    username=get('username', 'N/A'),
+                    email=get('email', 'N/A'),
+                    city=(get('address') or _EMPTY).get('city', 'N/A')
+                ))
             except (KeyError, TypeError) as e:
-                self.logger.warning(f"Error parsing user {idx}: {e}")
+                self.logger.warning("Error parsing user %d: %s", idx, e)
+        sys.stdout.write(''.join(buf))
     
     def _display_json(self, users: List[Dict]) -> None:
         """Display users in JSON format"""
         output = []
         for user in users:
+            get = user.get
             output.append({
-                'name': user.get('name', 'N/A'),
-                'username': user.get('username', 'N/A'),
-                'email': user.get('email', 'N/A'),
-                'city': user.get('address', {}).get('city', 'N/A'),
-                'phone': user.get('phone', 'N/A'),
-                'company': user.get('company', {}).get('name', 'N/A')
+                'name': get('name', 'N/A'),
+                'username': get('username', 'N/A'),
+                'email': get('email', 'N/A'),
+                'city': (get('address') or _EMPTY).get('city', 'N/A'),
+                'phone': get('phone', 'N/A'),
+                'company': (get('company') or _EMPTY).get('name', 'N/A')
             })
+        # stdlib on purpose: ASCII-escaped output is safe on any terminal encoding
         print(json.dumps(output, indent=2))
     
     def _display_csv(self, users: List[Dict]) -> None:
         """Display users in CSV format"""
-        print("Name,Username,Email,City,Phone,Company")
-        for user in users:
-            name = user.get('name', 'N/A')
-            username = user.get('username', 'N/A')
-            email = user.get('email', 'N/A')
-            city = user.get('address', {}).get('city', 'N/A')
-            phone = user.get('phone', 'N/A')
-            company = user.get('company', {}).get('name', 'N/A')
-            print(f'"{name}","{username}","{email}","{city}","{phone}","{company}"')
+        buf = io.StringIO()
+        writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+        writer.writerow(['Name', 'Username', 'Email', 'City', 'Phone', 'Company'])
+        writer.writerows(
+            (
+                user.get('name', 'N/A'),
+                user.get('username', 'N/A'),
+                user.get('email', 'N/A'),
+                (user.get('address') or _EMPTY).get('city', 'N/A'),
+                user.get('phone', 'N/A'),
+                (user.get('company') or _EMPTY).get('name', 'N/A')
+            )
+            for user in users
+        )
+        sys.stdout.write(buf.getvalue())
     
     def get_statistics(self) -> None:
         """Display statistics about the fetched users"""
@@ -291,33 +766,25 @@ class UserFetcher:
         print(f"   Total Users: {len(self.users)}")
         
         # Count users by city
-        cities = {}
-        domains = {}
+        cities = Counter(self._cities)
         
-        for user in self.users:
-            city = user.get('address', {}).get('city', 'Unknown')
-            cities[city] = cities.get(city, 0) + 1
-            
-            # Email domain analysis
-            email = user.get('email', '')
-            if '@' in email:
-                domain = email.split('@')[1]
-                domains[domain] = domains.get(domain, 0) + 1
+        # Email domain analysis
+        domains = Counter(domain for domain in self._domains if domain is not None)
         
         print(f"   Unique Cities: {len(cities)}")
         
         # Cities starting with S
-        s_cities = [city for city in cities.keys() if city.startswith('S')]
-        print(f"   Cities starting with 'S': {len(s_cities)}")
+        s_cities = sum(1 for city in cities if _starts_with_s(city))
+        print(f"   Cities starting with 'S': {s_cities}")
         
         # Most common city
         if cities:
-            most_common = max(cities.items(), key=lambda x: x[1])
+            most_common = cities.most_common(1)[0]
             print(f"   Most common city: {most_common[0]} ({most_common[1]} users)")
         
         # Most common email domain
         if domains:
-            most_common_domain = max(domains.items(), key=lambda x: x[1])
+            most_common_domain = domains.most_common(1)[0]
             print(f"   Most common email domain: {most_common_domain[0]} ({most_common_domain[1]} users)")
     
     def search_users(self, query: str, field: str = 'name') -> List[Dict]:
@@ -325,19 +792,16 @@ class UserFetcher:
         if not self.users:
             return []
         
-        self.logger.info(f"Searching for '{query}' in field '{field}'")
-        results = []
+        self.logger.info("Searching for '%s' in field '%s'", query, field)
         
-        for user in self.users:
-            if field == 'city':
-                value = user.get('address', {}).get('city', '').lower()
-            else:
-                value = user.get(field, '').lower()
-            
-            if query.lower() in value:
-                results.append(user)
+        # Common fields are indexed by _build_columns; index any other field on first use
+        if field not in self._search_index:
+            self._search_index[field] = [_fold(user.get(field)) for user in self.users]
+        
+        q = query.casefold()
+        results = [user for user, value in zip(self.users, self._search_index[field]) if q in value]
         
-        self.logger.info(f"Found {len(results)} matching users")
+        self.logger.info("Found %d matching users", len(results))
         return results
     
     def save_to_file(self, filename: str, format_type: str = 'json') -> None:
@@ -347,52 +811,50 @@ class UserFetcher:
             return
         
         try:
-            output_dir = Path('output')
-            output_dir.mkdir(exist_ok=True)
-            filepath = output_dir / filename
+            filepath = _ensure_dir(OUTPUT_DIR) / filename
             
             if format_type == 'json':
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(self.users, f, indent=2, ensure_ascii=False)
+                filepath.write_bytes(_dumps(self.users, indent=True))
             elif format_type == 'csv':
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write("Name,Username,Email,City,Phone,Company,Website\n")
-                    for user in self.users:
-                        name = user.get('name', 'N/A')
-                        username = user.get('username', 'N/A')
-                        email = user.get('email', 'N/A')
-                        city = user.get('address', {}).get('city', 'N/A')
-                        phone = user.get('phone', 'N/A')
-                        company = user.get('company', {}).get('name', 'N/A')
-                        website = user.get('website', 'N/A')
-                        f.write(f'"{name}","{username}","{email}","{city}","{phone}","{company}","{website}"\n')
+                # 1 MiB buffer so csv.writer rows are flushed in a few large writes
+                with open(filepath, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+                    writer.writerow(['Name', 'Username', 'Email', 'City', 'Phone', 'Company', 'Website'])
+                    writer.writerows(zip(
+                        self._names, self._usernames, self._emails, self._cities,
+                        self._phones, self._companies, self._websites
+                    ))
             
-            self.logger.info(f"Data saved to {filepath}")
+            self.logger.info("Data saved to %s", filepath)
             print(f"✅ Data saved to {filepath}")
         except Exception as e:
-            self.logger.error(f"Error saving file: {e}")
+            self.logger.error("Error saving file: %s", e)
             print(f"❌ Error saving file: {e}")
     
     def clear_cache(self) -> None:
         """Clear the cache"""
         if self.cache:
             self.cache.clear()
+            if hasattr(self.session, 'cache'):
+                self.session.cache.clear()
             print("✅ Cache cleared successfully")
             self.logger.info("Cache cleared")
 
 
 def print_header():
     """Print application header"""
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print("        📋 USER DATA FETCHER v3.0 - Production Ready")
-    print("=" * 70)
+    print(_BANNER)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"⏰ Execution Time: {timestamp}")
-    print("=" * 70 + "\n")
+    print(_BANNER + "\n")
 
 
 def parse_arguments():
     """Parse command line arguments"""
+    import argparse  # only needed for CLI runs
+    
     parser = argparse.ArgumentParser(
         description='Fetch and display user data from JSONPlaceholder API',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -432,6 +894,10 @@ def main():
     """Main function"""
     args = parse_arguments()
     
+    # Block-buffer stdout; large listings are flushed once at the end
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     # Setup logging
     logger = setup_logging(verbose=args.verbose)
     logger.info("Starting User Fetcher application")
@@ -439,59 +905,60 @@ def main():
     print_header()
     
     # Initialize fetcher
-    fetcher = UserFetcher(
+    with UserFetcher(
         timeout=args.timeout, 
         use_cache=not args.no_cache,
         logger=logger
-    )
-    
-    # Handle cache clearing
-    if args.clear_cache:
-        fetcher.clear_cache()
-        return
-    
-    # Fetch users
-    users = fetcher.fetch_users()
-    
-    if users is None:
-        logger.error("Failed to fetch users")
-        sys.exit(1)
-    
-    # Handle search
-    if args.search:
-        print(f"\n🔍 Searching for '{args.search}' in {args.search_field}...\n")
-        users = fetcher.search_users(args.search, args.search_field)
-        if not users:
-            print(f"❌ No users found matching '{args.search}'")
-            logger.info(f"No search results for '{args.search}'")
-            sys.exit(0)
-        print(f"✅ Found {len(users)} matching user(s)\n")
-    
-    # Display users
-    print("=" * 70)
-    if args.filter_s:
-        print("🏙️  USERS FROM CITIES STARTING WITH 'S'")
-    else:
-        print("👥 ALL USERS")
-    print("=" * 70 + "\n")
-    
-    fetcher.display_users(users, filter_by_s=args.filter_s, 
-                         format_type=args.format, limit=args.limit)
-    
-    # Show statistics
-    if args.stats:
-        fetcher.get_statistics()
-    
-    # Save to file
-    if args.save:
-        file_format = 'json' if args.save.endswith('.json') else 'csv'
-        fetcher.save_to_file(args.save, file_format)
-    
-    print("\n" + "=" * 70)
-    print("✅ Script execution completed successfully!")
-    print("=" * 70 + "\n")
+    ) as fetcher:
+        # Handle cache clearing
+        if args.clear_cache:
+            fetcher.clear_cache()
+            return
+        
+        # Fetch users; a plain --limit listing only needs the first few records
+        needs_all = args.stats or args.search or args.filter_s or args.save
+        users = fetcher.fetch_users(limit=None if needs_all else args.limit)
+        
+        if users is None:
+            logger.error("Failed to fetch users")
+            sys.exit(1)
+        
+        # Handle search
+        if args.search:
+            print(f"\n🔍 Searching for '{args.search}' in {args.search_field}...\n")
+            users = fetcher.search_users(args.search, args.search_field)
+            if not users:
+                print(f"❌ No users found matching '{args.search}'")
+                logger.info("No search results for '%s'", args.search)
+                sys.exit(0)
+            print(f"✅ Found {len(users)} matching user(s)\n")
+        
+        # Display users
+        print(_BANNER)
+        if args.filter_s:
+            print("🏙️  USERS FROM CITIES STARTING WITH 'S'")
+        else:
+            print("👥 ALL USERS")
+        print(_BANNER + "\n")
+        
+        fetcher.display_users(users, filter_by_s=args.filter_s, 
+                             format_type=args.format, limit=args.limit)
+        
+        # Show statistics
+        if args.stats:
+            fetcher.get_statistics()
+        
+        # Save to file
+        if args.save:
+            file_format = 'json' if args.save.endswith('.json') else 'csv'
+            fetcher.save_to_file(args.save, file_format)
+        
+        print("\n" + _BANNER)
+        print("✅ Script execution completed successfully!")
+        print(_BANNER + "\n")
     
     logger.info("Application finished successfully")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
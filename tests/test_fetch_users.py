@@ -0,0 +1,130 @@
+import http.server
+import json
+import threading
+
+import pytest
+
+from src import fetch_users as fu
+
+
+class _ShortBodyHandler(http.server.BaseHTTPRequestHandler):
+    """Promises more bytes than it sends, then closes the connection"""
+
+    def do_GET(self):
+        body = b'[{"id": 1, "name": "Leanne Graham"}, {"id": 2'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '5000')
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def short_body_url():
+    server = http.server.HTTPServer(('127.0.0.1', 0), _ShortBodyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/users'
+    server.shutdown()
+    server.server_close()
+
+
+_USERS_BODY = json.dumps([
+    {'id': i, 'name': f'User {i}', 'email': f'user{i}@example.com', 'address': {'city': 'Springfield'}}
+    for i in range(1, 13)
+]).encode()
+
+
+class _UsersHandler(http.server.BaseHTTPRequestHandler):
+    """Serves a fixed user list and counts the requests it receives"""
+
+    requests_served = 0
+
+    def do_GET(self):
+        type(self).requests_served += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(_USERS_BODY)))
+        self.end_headers()
+        self.wfile.write(_USERS_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def users_server():
+    _UsersHandler.requests_served = 0
+    server = http.server.HTTPServer(('127.0.0.1', 0), _UsersHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/users', _UsersHandler
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def isolated_dirs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(fu, 'USER_CACHE_DIR', tmp_path / 'user_cache')
+
+
+def test_truncated_stream_is_reported_as_request_failure(short_body_url, isolated_dirs, monkeypatch):
+    pytest.importorskip('ijson')
+    monkeypatch.setattr(fu.UserFetcher, 'BASE_URL', short_body_url)
+    fetcher = fu.UserFetcher(use_cache=False)
+
+    assert fetcher.fetch_users(limit=5) is None
+    assert fetcher.breaker.failure_count == 1
+
+
+def test_limited_fetch_fills_cache_for_later_runs(users_server, isolated_dirs, monkeypatch):
+    url, handler = users_server
+    monkeypatch.setattr(fu.UserFetcher, 'BASE_URL', url)
+
+    first = fu.UserFetcher(use_cache=True).fetch_users(limit=3)
+    second = fu.UserFetcher(use_cache=True).fetch_users(limit=3)
+
+    assert len(first) == 12
+    assert second == first
+    assert handler.requests_served == 1
+
+
+def test_assigning_users_rebuilds_columns(isolated_dirs):
+    fetcher = fu.UserFetcher(use_cache=False)
+    fetcher.users = [
+        {'name': 'Ada', 'email': 'ada@example.com', 'address': {'city': 'Springfield'}},
+        {'name': 'Grace', 'email': 'grace@example.org', 'address': {'city': 'Boston'}},
+    ]
+
+    assert fetcher._cities == ['Springfield', 'Boston']
+    assert fetcher._starts_s_mask == [True, False]
+    assert fetcher.search_users('grace') == [fetcher.users[1]]
+
+
+def test_null_fields_do_not_break_columns_or_search(isolated_dirs, capsys):
+    fetcher = fu.UserFetcher(use_cache=False)
+    fetcher.users = [
+        {'name': None, 'username': None, 'email': None, 'address': {'city': None}, 'id': 1},
+        {'name': 'Sam', 'email': 'sam@example.com', 'address': {'city': 'Seattle'}, 'id': 2},
+    ]
+
+    assert fetcher._domains == [None, 'example.com']
+    assert fetcher._starts_s_mask == [False, True]
+    assert fetcher.search_users('sam') == [fetcher.users[1]]
+    assert fetcher.search_users('2', field='id') == [fetcher.users[1]]
+
+    # A search result is a new list, so --filter-s takes the per-user path, not the mask
+    subset = fetcher.search_users('', field='email')
+    assert subset is not fetcher.users
+    fetcher.display_users(subset, filter_by_s=True, format_type='minimal')
+    out = capsys.readouterr().out
+    assert 'Name: Sam' in out
+    assert out.count('Name:') == 1
+
+    fetcher.get_statistics()
+    assert "Cities starting with 'S': 1" in capsys.readouterr().out